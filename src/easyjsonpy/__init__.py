@@ -1,5 +1,5 @@
 from .lang_loader import load_language, load_languages, async_load_language, async_load_languages, set_language, get_current_language, get_language, get_languages, remove_language, remove_languages, remove_all_languages, translate_message
-from .config_loader import load_configuration, async_load_configuration, load_configurations, async_load_configurations, get_configuration, get_configurations, get_config_value, async_set_config_value, set_config_value, remove_configuration, remove_all_configurations
+from .config_loader import load_configuration, load_configuration_subset, async_load_configuration, load_configurations, async_load_configurations, get_configuration, get_configurations, get_config_value, async_set_config_value, set_config_value, flush_config, remove_configuration, remove_all_configurations
 
 __all__ = [
     'load_language',
@@ -15,6 +15,7 @@ __all__ = [
     'remove_all_languages',
     'translate_message',
     'load_configuration',
+    'load_configuration_subset',
     'async_load_configuration',
     'load_configurations',
     'async_load_configurations',
@@ -23,6 +24,7 @@ __all__ = [
     'get_config_value',
     'async_set_config_value',
     'set_config_value',
+    'flush_config',
     'remove_configuration',
     'remove_all_configurations'
 ]
\ No newline at end of file
@@ -1,249 +1,285 @@
+import asyncio
+import atexit
 import json
+import mmap
 import os
+import pickle
+import sys
 import aiofiles
 
-from .exceptions import ConfigurationAlreadyLoadedError, ConfigurationFileNotFoundError, ConfigurationNotLoadedError
+from concurrent.futures import ThreadPoolExecutor
 
-from typing import Union, Dict, Optional, List
-from functools import reduce
+try:
+    import orjson
 
+except ImportError:
+    orjson = None
 
-class ConfigLoader:
-    _instance: Optional['ConfigLoader'] = None
-    configurations: Dict[str, dict]
-    config_paths: Dict[str, str]
+try:
+    import ijson
 
-    def __new__(cls, *args, **kwargs) -> 'ConfigLoader':
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.configurations = {}
-            cls._instance.config_paths = {}
+except ImportError:
+    ijson = None
 
-        return cls._instance
+from .exceptions import ConfigurationAlreadyLoadedError, ConfigurationFileNotFoundError, ConfigurationNotLoadedError
 
-    def load_configuration(self, config_name: str, config_path: Union[str, os.PathLike]) -> None:
-        """
-        Load a configuration from a JSON file
+from typing import Union, Dict, List, Optional, Tuple
+from functools import lru_cache
 
-        Args:
-            config_name (str): Configuration name
-            config_path (Union[str, os.PathLike]): Path to the configuration file
 
-        Raises:
-            ConfigurationAlreadyLoadedError: Configuration already loaded
-            ConfigurationFileNotFoundError: Configuration file not found
-            ValueError: Configuration file is not a valid JSON file
-        """
+# Files at least this large are parsed straight from an mmap'ed view
+# instead of an intermediate bytes copy (orjson accepts buffer objects,
+# the stdlib parser does not)
+_MMAP_THRESHOLD = 1024 * 1024
 
-        if config_name in self.configurations:
-            raise ConfigurationAlreadyLoadedError(f'Configuration {config_name} already loaded')
+_configurations: Dict[str, dict] = {}
+_config_paths: Dict[str, Union[str, os.PathLike]] = {}
+_flat_configurations: Dict[str, dict] = {}
+_dirty_configurations: set = set()
 
-        if not os.path.exists(config_path):
-            raise ConfigurationFileNotFoundError(f'Configuration file {config_path} not found')
 
-        with open(config_path, 'r', encoding='utf-8') as config_file:
-            try:
-                self.configurations[config_name] = json.load(config_file)
-                self.config_paths[config_name] = config_path
-            except json.decoder.JSONDecodeError:
-                raise ValueError(f'Configuration file {config_path} is not a valid JSON file')
+if orjson is not None:
+    _json_loads = orjson.loads
 
-    async def async_load_configuration(self, config_name: str, config_path: Union[str, os.PathLike]) -> None:
-        """
-        Load a configuration from a JSON file asynchronously
+    def _json_dumps(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
 
-        Args:
-            config_name (str): Configuration name
-            config_path (Union[str, os.PathLike]): Path to the configuration file
+else:
+    _json_loads = json.loads
 
-        Raises:
-            ConfigurationAlreadyLoadedError: Configuration already loaded
-            ConfigurationFileNotFoundError: Configuration file not found
-            ValueError: Configuration file is not a valid JSON file
-        """
+    def _json_dumps(data: dict) -> bytes:
+        return json.dumps(data, indent=4).encode('utf-8')
 
-        if config_name in self.configurations:
-            raise ConfigurationAlreadyLoadedError(f'Configuration {config_name} already loaded')
 
-        if not os.path.exists(config_path):
-            raise ConfigurationFileNotFoundError(f'Configuration file {config_path} not found')
-
-        async with aiofiles.open(config_path, 'r', encoding='utf-8') as config_file:
-            content: str = await config_file.read()
+@lru_cache(maxsize=1024)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """
+    Split a dotted key into its segments, caching the result for hot keys
 
-            try:
-                self.configurations[config_name] = json.loads(content)
-                self.config_paths[config_name] = config_path
+    Args:
+        key (str): Dotted key (example: 'key1.key2.key3')
 
-            except json.decoder.JSONDecodeError:
-                raise ValueError(f'Configuration file {config_path} is not a valid JSON file')
+    Returns:
+        Tuple[str, ...]: Key segments
+    """
 
-    def load_configurations(self, configurations: List[Dict[str, Union[str, os.PathLike]]]) -> None:
-        """
-        Load multiple configurations from JSON files
+    return tuple(sys.intern(k) for k in key.split('.'))
 
-        Args:
-            configurations (List[Dict[str, Union[str, os.PathLike]]]): List of dictionaries with configuration names and paths
-        """
 
-        self._check_configuration_list(configurations=configurations)
+def _flatten(data: dict, prefix: str = '', flat: Optional[dict] = None) -> dict:
+    """
+    Flatten a nested dictionary into a single-level dictionary keyed by dotted paths
+    Intermediate dictionaries are kept under their own dotted path as well
+    Non-dictionary input (a JSON document whose top level is not an object) yields an empty dictionary
 
-        for configuration in configurations:
-            self.load_configuration(configuration['name'], configuration['path'])
+    Args:
+        data (dict): Nested dictionary
+        prefix (str, optional): Dotted path prefix of the current level. Defaults to ''.
+        flat (Optional[dict], optional): Dictionary to populate. Defaults to None.
 
-    async def async_load_configurations(self, configurations: List[Dict[str, Union[str, os.PathLike]]]) -> None:
-        """
-        Load multiple configurations from JSON files asynchronously
+    Returns:
+        dict: Flattened dictionary
+    """
 
-        Args:
-            configurations (List[Dict[str, Union[str, os.PathLike]]]): List of dictionaries with configuration names and paths
-        """
+    if flat is None:
+        flat = {}
 
-        self._check_configuration_list(configurations=configurations)
+    if type(data) is not dict:
+        return flat
 
-        for configuration in configurations:
-            await self.async_load_configuration(configuration['name'], configuration['path'])
+    for k, v in data.items():
+        dotted = sys.intern(f'{prefix}{k}')
+        flat[dotted] = v
 
-    def get_config(self, key: str, config_name: str) -> Union[str, int, float, bool, None, dict, list]:
-        """
-        Get a value from a configuration by key
-        The key can be a nested key separated by dots (example: 'key1.key2.key3')
+        if type(v) is dict:
+            _flatten(v, f'{dotted}.', flat)
 
-        Args:
-            key (str): Key to get the value from
-            config_name (str): Configuration name
+    return flat
 
-        Raises:
-            ConfigurationNotLoadedError: Configuration not loaded
 
-        Returns:
-            Union[str, int, float, bool, None, dict, list]: Value from the configuration
-        """
+def _read_configuration_file(config_path: Union[str, os.PathLike]) -> dict:
+    """
+    Read and parse a configuration file
 
-        if config_name not in self.configurations:
-            raise ConfigurationNotLoadedError(f'Configuration {config_name} not loaded')
+    Args:
+        config_path (Union[str, os.PathLike]): Path to the configuration file
 
-        keys = key.split('.')
-        return reduce(lambda d, k: d.get(k, key) if isinstance(d, dict) else key, keys, self.configurations[config_name])
+    Raises:
+        ConfigurationFileNotFoundError: Configuration file not found
+        ValueError: Configuration file is not a valid JSON file
 
-    def set_config(self, key: str, value: Union[str, int, float, bool, None, dict, list], config_name: str) -> None:
-        """
-        Set a value in a configuration by key and save the changes to the configuration file
+    Returns:
+        dict: Parsed configuration
+    """
 
-        Args:
-            key (str): Key to set the value in
-            value (Union[str, int, float, bool, None, dict, list]): Value to set
-            config_name (str): Configuration name
+    try:
+        config_file = open(config_path, 'rb')
+    except FileNotFoundError:
+        raise ConfigurationFileNotFoundError(f'Configuration file {config_path} not found')
 
-        Raises:
-            ConfigurationNotLoadedError: Configuration not loaded
-        """
+    with config_file:
+        try:
+            if orjson is not None and os.fstat(config_file.fileno()).st_size >= _MMAP_THRESHOLD:
+                with mmap.mmap(config_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return _json_loads(memoryview(mapped))
 
-        if config_name not in self.configurations:
-            raise ConfigurationNotLoadedError(f'Configuration {config_name} not loaded')
+            return _json_loads(config_file.read())
+        except json.decoder.JSONDecodeError:
+            raise ValueError(f'Configuration file {config_path} is not a valid JSON file')
 
-        key_parts: List[str] = key.split('.')
-        config_dict: dict = self.configurations[config_name]
 
-        for k in key_parts[:-1]:
-            config_dict: dict = config_dict.setdefault(k, {})
+def _load_cached_configuration(config_path: Union[str, os.PathLike]) -> Optional[dict]:
+    """
+    Load a configuration from its sidecar cache if it is still up to date
 
-        config_dict[key_parts[-1]] = value
-        config_path: str = self.config_paths[config_name]
+    Args:
+        config_path (Union[str, os.PathLike]): Path to the configuration file
 
-        with open(config_path, 'w', encoding='utf-8') as config_file:
-            json.dump(self.configurations[config_name], config_file, indent=4)
+    Returns:
+        Optional[dict]: Cached configuration, or None when the cache is missing or stale
+    """
 
-    async def async_set_config(self, key: str, value: Union[str, int, float, bool, None, dict, list], config_name: str) -> None:
-        """
-        Set a value in a configuration by key and save the changes to the configuration file asynchronously
+    try:
+        src_mtime = os.stat(config_path).st_mtime_ns
 
-        Args:
-            key (str): Key to set the value in
-            value (Union[str, int, float, bool, None, dict, list]): Value to set
-            config_name (str): Configuration name
+        with open(f'{config_path}.cache.pkl', 'rb') as cache_file:
+            cached = pickle.load(cache_file)
 
-        Raises:
-            ConfigurationNotLoadedError: Configuration not loaded
-        """
+    except (OSError, pickle.PickleError, EOFError):
+        return None
 
-        if config_name not in self.configurations:
-            raise ConfigurationNotLoadedError(f'Configuration {config_name} not loaded')
+    if type(cached) is not dict or cached.get('mtime') != src_mtime:
+        return None
 
-        key_parts = key.split('.')
-        config_dict = self.configurations[config_name]
+    return cached.get('data')
 
-        for part in key_parts[:-1]:
-            config_dict = config_dict.setdefault(part, {})
 
-        config_dict[key_parts[-1]] = value
-        config_path = self.config_paths[config_name]
+def _write_configuration_cache(config_path: Union[str, os.PathLike], data: dict) -> None:
+    """
+    Write the parsed configuration to its sidecar cache, keyed by the source file's mtime
 
-        async with aiofiles.open(config_path, 'w', encoding='utf-8') as config_file:
-            await config_file.write(json.dumps(self.configurations[config_name], indent=4))
+    Args:
+        config_path (Union[str, os.PathLike]): Path to the configuration file
+        data (dict): Parsed configuration
+    """
 
-    def get_configurations(self) -> Dict[str, dict]:
-        """
-        Get all loaded configurations
+    try:
+        src_mtime = os.stat(config_path).st_mtime_ns
 
-        Returns:
-            Dict[str, dict]: Loaded configurations
-        """
+        with open(f'{config_path}.cache.pkl', 'wb') as cache_file:
+            pickle.dump({'mtime': src_mtime, 'data': data}, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
 
-        return self.configurations
+    except OSError:
+        pass
 
-    def _check_configuration_list(self, configurations: List[Dict[str, Union[str, os.PathLike]]]) -> None:
-        """
-        Check if a list of configurations is valid
 
-        Args:
-            configurations (List[Dict[str, Union[str, os.PathLike]]]): List of dictionaries with configuration names and paths
+def _validate_configuration_entry(configuration: Dict[str, Union[str, os.PathLike]]) -> Tuple[str, Union[str, os.PathLike]]:
+    """
+    Validate a single configuration entry and extract its name and path
 
-        Raises:
-            ValueError: Configuration list is not valid
-            ValueError: Configuration entry is not valid
-            ValueError: Configuration dictionary is not valid
-            ValueError: "name" must be a string and "path" must be a string or os.PathLike
-        """
+    Args:
+        configuration (Dict[str, Union[str, os.PathLike]]): Dictionary with a configuration name and path
 
-        if not isinstance(configurations, list):
-            raise ValueError('configurations must be a list of dictionaries')
+    Raises:
+        ValueError: Configuration entry is not valid
+        ValueError: Configuration dictionary is not valid
+        ValueError: "name" must be a string and "path" must be a string or os.PathLike
 
-        for configuration in configurations:
-            if not isinstance(configuration, dict):
-                raise ValueError('Each configuration entry must be a dictionary')
+    Returns:
+        Tuple[str, Union[str, os.PathLike]]: Configuration name and path
+    """
 
-            if 'name' not in configuration or 'path' not in configuration:
-                raise ValueError('Each configuration dictionary must have "name" and "path" keys')
+    if type(configuration) is not dict:
+        raise ValueError('Each configuration entry must be a dictionary')
 
-            if not isinstance(configuration['name'], str) or not isinstance(configuration['path'], (str, os.PathLike)):
-                raise ValueError('"name" must be a string and "path" must be a string or os.PathLike')
+    try:
+        name = configuration['name']
+        path = configuration['path']
+    except KeyError:
+        raise ValueError('Each configuration dictionary must have "name" and "path" keys')
 
+    if type(name) is not str or not isinstance(path, (str, os.PathLike)):
+        raise ValueError('"name" must be a string and "path" must be a string or os.PathLike')
 
-config_loader = ConfigLoader()
+    return name, path
 
 
-def load_configuration(config_name: str, config_path: Union[str, os.PathLike]) -> None:
+def load_configuration(config_name: str, config_path: Union[str, os.PathLike], use_cache: bool = False) -> None:
     """
     Load a configuration from a JSON file
+    With use_cache=True the parsed configuration is stored in a sidecar
+    pickle next to the JSON file and reused on later loads as long as the
+    source file's mtime is unchanged, skipping the JSON parse entirely
 
     Args:
         config_name (str): Configuration name
         config_path (Union[str, os.PathLike]): Path to the configuration file
+        use_cache (bool, optional): Reuse and maintain a sidecar parse cache. Defaults to False.
+
+    Raises:
+        ConfigurationAlreadyLoadedError: Configuration already loaded
+        ConfigurationFileNotFoundError: Configuration file not found
+        ValueError: Configuration file is not a valid JSON file
     """
 
-    config_loader.load_configuration(config_name, config_path)
+    if config_name in _configurations:
+        raise ConfigurationAlreadyLoadedError(f'Configuration {config_name} already loaded')
 
+    data = _load_cached_configuration(config_path) if use_cache else None
 
-def load_configurations(configurations: List[Dict[str, Union[str, os.PathLike]]]) -> None:
+    if data is None:
+        data = _read_configuration_file(config_path)
+
+        if use_cache:
+            _write_configuration_cache(config_path, data)
+
+    _configurations[config_name] = data
+    _config_paths[config_name] = config_path
+    _flat_configurations[config_name] = _flatten(data)
+
+
+def load_configuration_subset(config_name: str, config_path: Union[str, os.PathLike], keys: List[str]) -> None:
     """
-    Load multiple configurations from JSON files
+    Load only the given top-level keys of a configuration from a JSON file
+    Useful for large configuration files where only a few keys are needed;
+    when the ijson package is installed the file is parsed as a stream and
+    unneeded keys are never materialized
 
     Args:
-        configurations (List[Dict[str, Union[str, os.PathLike]]]): List of dictionaries with configuration names and paths
+        config_name (str): Configuration name
+        config_path (Union[str, os.PathLike]): Path to the configuration file
+        keys (List[str]): Top-level keys to keep
+
+    Raises:
+        ConfigurationAlreadyLoadedError: Configuration already loaded
+        ConfigurationFileNotFoundError: Configuration file not found
+        ValueError: Configuration file is not a valid JSON file
     """
 
-    config_loader.load_configurations(configurations)
+    if config_name in _configurations:
+        raise ConfigurationAlreadyLoadedError(f'Configuration {config_name} already loaded')
+
+    keys_set = frozenset(keys)
+
+    if ijson is not None:
+        try:
+            config_file = open(config_path, 'rb')
+        except FileNotFoundError:
+            raise ConfigurationFileNotFoundError(f'Configuration file {config_path} not found')
+
+        with config_file:
+            try:
+                data = {k: v for k, v in ijson.kvitems(config_file, '') if k in keys_set}
+            except ijson.JSONError:
+                raise ValueError(f'Configuration file {config_path} is not a valid JSON file')
+
+    else:
+        full_data = _read_configuration_file(config_path)
+        data = {k: v for k, v in full_data.items() if k in keys_set}
+
+    _configurations[config_name] = data
+    _config_paths[config_name] = config_path
+    _flat_configurations[config_name] = _flatten(data)
 
 
 async def async_load_configuration(config_name: str, config_path: Union[str, os.PathLike]) -> None:
@@ -252,10 +288,56 @@ async def async_load_configuration(config_name: str, config_path: Union[str, os.
 
     Args:
         config_name (str): Configuration name
-        config_path (Union[str, os.PathLike]): Configuration path
+        config_path (Union[str, os.PathLike]): Path to the configuration file
+
+    Raises:
+        ConfigurationAlreadyLoadedError: Configuration already loaded
+        ConfigurationFileNotFoundError: Configuration file not found
+        ValueError: Configuration file is not a valid JSON file
     """
 
-    await config_loader.async_load_configuration(config_name, config_path)
+    if config_name in _configurations:
+        raise ConfigurationAlreadyLoadedError(f'Configuration {config_name} already loaded')
+
+    data = await asyncio.to_thread(_read_configuration_file, config_path)
+    _configurations[config_name] = data
+    _config_paths[config_name] = config_path
+    _flat_configurations[config_name] = _flatten(data)
+
+
+def load_configurations(configurations: List[Dict[str, Union[str, os.PathLike]]]) -> None:
+    """
+    Load multiple configurations from JSON files
+
+    Args:
+        configurations (List[Dict[str, Union[str, os.PathLike]]]): List of dictionaries with configuration names and paths
+    """
+
+    if not isinstance(configurations, list):
+        raise ValueError('configurations must be a list of dictionaries')
+
+    if not configurations:
+        return
+
+    names: List[str] = []
+    paths: List[Union[str, os.PathLike]] = []
+
+    for configuration in configurations:
+        name, path = _validate_configuration_entry(configuration)
+
+        if name in _configurations or name in names:
+            raise ConfigurationAlreadyLoadedError(f'Configuration {name} already loaded')
+
+        names.append(name)
+        paths.append(path)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        results = list(executor.map(_read_configuration_file, paths))
+
+    for name, path, data in zip(names, paths, results):
+        _configurations[name] = data
+        _config_paths[name] = path
+        _flat_configurations[name] = _flatten(data)
 
 
 async def async_load_configurations(configurations: List[Dict[str, Union[str, os.PathLike]]]) -> None:
@@ -266,7 +348,32 @@ async def async_load_configurations(configurations: List[Dict[str, Union[str, os
         configurations (List[Dict[str, Union[str, os.PathLike]]]): List of dictionaries with configuration names and paths
     """
 
-    await config_loader.async_load_configurations(configurations)
+    if not isinstance(configurations, list):
+        raise ValueError('configurations must be a list of dictionaries')
+
+    if not configurations:
+        return
+
+    names: List[str] = []
+    paths: List[Union[str, os.PathLike]] = []
+
+    for configuration in configurations:
+        name, path = _validate_configuration_entry(configuration)
+
+        if name in _configurations or name in names:
+            raise ConfigurationAlreadyLoadedError(f'Configuration {name} already loaded')
+
+        names.append(name)
+        paths.append(path)
+
+    # Gather pure reads and commit only once every file has parsed, so a
+    # failing batch leaves the stores untouched like the sync bulk loader
+    results = await asyncio.gather(*(asyncio.to_thread(_read_configuration_file, path) for path in paths))
+
+    for name, path, data in zip(names, paths, results):
+        _configurations[name] = data
+        _config_paths[name] = path
+        _flat_configurations[name] = _flatten(data)
 
 
 def get_configuration(config_name: str) -> dict:
@@ -283,10 +390,12 @@ def get_configuration(config_name: str) -> dict:
         dict: Loaded configuration
     """
 
-    if config_name not in config_loader.get_configurations():
+    configuration = _configurations.get(config_name)
+
+    if configuration is None:
         raise ConfigurationNotLoadedError(f'Configuration {config_name} not loaded')
 
-    return config_loader.get_configurations()[config_name]
+    return configuration
 
 
 def get_configurations() -> Dict[str, dict]:
@@ -297,47 +406,151 @@ def get_configurations() -> Dict[str, dict]:
         Dict[str, dict]: Loaded configurations
     """
 
-    return config_loader.get_configurations()
+    return _configurations
 
 
 def get_config_value(key: str, config_name: str = 'default') -> Union[str, int, float, bool, None, dict, list]:
     """
     Get a value from a configuration by key
+    The key can be a nested key separated by dots (example: 'key1.key2.key3')
 
     Args:
         key (str): Key to get the value from
         config_name (str, optional): Configuration name. Defaults to 'default'.
 
+    Raises:
+        ConfigurationNotLoadedError: Configuration not loaded
+
     Returns:
         Union[str, int, float, bool, None, dict, list]: Value from the configuration
     """
 
-    return config_loader.get_config(key, config_name)
+    flat = _flat_configurations.get(config_name)
+
+    if flat is None:
+        raise ConfigurationNotLoadedError(f'Configuration {config_name} not loaded')
 
+    return flat.get(key, key)
 
-def set_config_value(key: str, value: Union[str, int, float, bool, None, dict, list], config_name: str = 'default') -> None:
+
+def set_config_value(key: str, value: Union[str, int, float, bool, None, dict, list], config_name: str = 'default', flush: bool = True) -> None:
     """
     Set a value in a configuration by key and save the changes to the configuration file
+    With flush=False the change is only applied in memory and the write is
+    deferred until flush_config is called (or the interpreter exits)
 
     Args:
         key (str): Key to set the value in
         value (Union[str, int, float, bool, None, dict, list]): Value to set
         config_name (str, optional): Configuration name. Defaults to 'default'.
+        flush (bool, optional): Write the configuration file immediately. Defaults to True.
+
+    Raises:
+        ConfigurationNotLoadedError: Configuration not loaded
     """
 
-    config_loader.set_config(key, value, config_name)
+    data = _configurations.get(config_name)
 
-async def async_set_config_value(key: str, value: Union[str, int, float, bool, None, dict, list], config_name: str = 'default') -> None:
+    if data is None:
+        raise ConfigurationNotLoadedError(f'Configuration {config_name} not loaded')
+
+    key_parts: Tuple[str, ...] = _split_key(key)
+    config_dict: dict = data
+
+    for k in key_parts[:-1]:
+        config_dict: dict = config_dict.setdefault(k, {})
+
+    config_dict[key_parts[-1]] = value
+    _flat_configurations[config_name] = _flatten(data)
+
+    if flush:
+        _write_configuration(config_name)
+    else:
+        _dirty_configurations.add(config_name)
+
+
+async def async_set_config_value(key: str, value: Union[str, int, float, bool, None, dict, list], config_name: str = 'default', flush: bool = True) -> None:
     """
     Set a value in a configuration by key and save the changes to the configuration file asynchronously
+    With flush=False the change is only applied in memory and the write is
+    deferred until flush_config is called (or the interpreter exits)
 
     Args:
         key (str): Key to set the value in
         value (Union[str, int, float, bool, None, dict, list]): Value to set
         config_name (str, optional): Configuration name. Defaults to 'default'.
+        flush (bool, optional): Write the configuration file immediately. Defaults to True.
+
+    Raises:
+        ConfigurationNotLoadedError: Configuration not loaded
+    """
+
+    data = _configurations.get(config_name)
+
+    if data is None:
+        raise ConfigurationNotLoadedError(f'Configuration {config_name} not loaded')
+
+    key_parts = _split_key(key)
+    config_dict = data
+
+    for part in key_parts[:-1]:
+        config_dict = config_dict.setdefault(part, {})
+
+    config_dict[key_parts[-1]] = value
+    _flat_configurations[config_name] = _flatten(data)
+
+    if not flush:
+        _dirty_configurations.add(config_name)
+        return
+
+    config_path = _config_paths[config_name]
+
+    async with aiofiles.open(config_path, 'wb') as config_file:
+        await config_file.write(_json_dumps(data))
+
+    _dirty_configurations.discard(config_name)
+
+
+def _write_configuration(config_name: str) -> None:
+    """
+    Write a loaded configuration back to its file
+
+    Args:
+        config_name (str): Configuration name
     """
 
-    await config_loader.async_set_config(key, value, config_name)
+    config_path = _config_paths[config_name]
+
+    with open(config_path, 'wb') as config_file:
+        config_file.write(_json_dumps(_configurations[config_name]))
+
+    _dirty_configurations.discard(config_name)
+
+
+def flush_config(config_name: Optional[str] = None) -> None:
+    """
+    Write pending configuration changes to disk
+    Without a name, every configuration with deferred changes is written
+
+    Args:
+        config_name (Optional[str], optional): Configuration name. Defaults to None.
+
+    Raises:
+        ConfigurationNotLoadedError: Configuration not loaded
+    """
+
+    if config_name is not None:
+        if config_name not in _configurations:
+            raise ConfigurationNotLoadedError(f'Configuration {config_name} not loaded')
+
+        _write_configuration(config_name)
+        return
+
+    for name in tuple(_dirty_configurations):
+        _write_configuration(name)
+
+
+atexit.register(flush_config)
 
 
 def remove_configuration(config_name: str) -> None:
@@ -348,10 +561,12 @@ def remove_configuration(config_name: str) -> None:
         config_name (str): Configuration name
     """
 
-    if config_name not in config_loader.get_configurations():
+    if config_name not in _configurations:
         raise ConfigurationNotLoadedError(f'Configuration {config_name} not loaded')
 
-    del config_loader.get_configurations()[config_name]
+    del _configurations[config_name]
+    _flat_configurations.pop(config_name, None)
+    _dirty_configurations.discard(config_name)
 
 
 def remove_all_configurations() -> None:
@@ -359,5 +574,7 @@ def remove_all_configurations() -> None:
     Remove all loaded configurations
     """
 
-    config_loader.get_configurations().clear()
-    config_loader.config_paths.clear()
+    _configurations.clear()
+    _config_paths.clear()
+    _flat_configurations.clear()
+    _dirty_configurations.clear()
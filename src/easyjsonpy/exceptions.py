@@ -1,23 +1,23 @@
 class LanguageAlreadyLoadedError(Exception):
     """Raised when the language is already loaded"""
-    pass
+    __slots__ = ()
 
 class LanguageNotLoadedError(Exception):
     """Raised when the language is not loaded but an attempt is made to use it"""
-    pass
+    __slots__ = ()
 
 class LanguageFileNotFoundError(FileNotFoundError):
     """Raised when the language file is not found"""
-    pass
+    __slots__ = ()
 
 class ConfigurationAlreadyLoadedError(Exception):
     """Raised when the configuration is already loaded"""
-    pass
+    __slots__ = ()
 
 class ConfigurationNotLoadedError(Exception):
     """Raised when the configuration is not loaded but an attempt is made to use it"""
-    pass
+    __slots__ = ()
 
 class ConfigurationFileNotFoundError(Exception):
     """Raised when the configuration file is not found"""
-    pass
+    __slots__ = ()
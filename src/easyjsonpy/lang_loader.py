@@ -1,199 +1,150 @@
+import asyncio
 import json
+import mmap
 import os
-import aiofiles
+import sys
 
-from .exceptions import LanguageAlreadyLoadedError, LanguageNotLoadedError, LanguageFileNotFoundError
-
-from typing import Union, Dict, Optional, List
-from functools import reduce
-
-
-class LangLoader:
-    _instance: Optional['LangLoader'] = None
-    languages: Dict[str, dict]
-    language: Optional[str]
-
-    def __new__(cls, *args, **kwargs) -> 'LangLoader':
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.languages = {}
-            cls._instance.language = None
-
-        return cls._instance
-
-    def load_language(self, lang_name: str, lang_path: Union[str, os.PathLike]) -> None:
-        """
-        Load a language file into the languages dictionary
-
-        Args:
-            lang_name (str): Language name
-            lang_path (Union[str, os.PathLike]): Path to the language file
-
-        Raises:
-            LanguageAlreadyLoadedError: Language already loaded
-            LanguageFileNotFoundError: Language file not found
-        """
-
-        if lang_name in self.languages:
-            raise LanguageAlreadyLoadedError(f'Language {lang_name} already loaded')
+from concurrent.futures import ThreadPoolExecutor
 
-        if not os.path.exists(lang_path):
-            raise LanguageFileNotFoundError(f'Language file {lang_path} not found')
+try:
+    import orjson
 
-        with open(lang_path, 'r', encoding='utf-8') as lang_file:
-            try:
-                self.languages[lang_name] = json.load(lang_file)
+except ImportError:
+    orjson = None
 
-            except json.decoder.JSONDecodeError:
-                raise ValueError(f'Language file {lang_path} is not a valid JSON file')
-
-    async def async_load_language(self, lang_name: str, lang_path: Union[str, os.PathLike]) -> None:
-        """
-        Asynchronously load a language file into the languages dictionary
-
-        Args:
-            lang_name (str): Language name
-            lang_path (Union[str, os.PathLike]): Path to the language file
-
-        Raises:
-            LanguageAlreadyLoadedError: Language already loaded
-            LanguageFileNotFoundError: Language file not found
-        """
-        if lang_name in self.languages:
-            raise LanguageAlreadyLoadedError(f'Language {lang_name} already loaded')
-
-        if not os.path.exists(lang_path):
-            raise LanguageFileNotFoundError(f'Language file {lang_path} not found')
+from .exceptions import LanguageAlreadyLoadedError, LanguageNotLoadedError, LanguageFileNotFoundError
 
-        async with aiofiles.open(lang_path, 'r', encoding='utf-8') as lang_file:
-            content = await lang_file.read()
+from typing import Union, Dict, Optional, List, Tuple
 
-            try:
-                self.languages[lang_name] = json.loads(content)
 
-            except json.decoder.JSONDecodeError:
-                raise ValueError(f'Language file {lang_path} is not a valid JSON file')
+# Files at least this large are parsed straight from an mmap'ed view
+# instead of an intermediate bytes copy (orjson accepts buffer objects,
+# the stdlib parser does not)
+_MMAP_THRESHOLD = 1024 * 1024
 
-    def load_languages(self, languages: List[Dict[str, Union[str, os.PathLike]]]) -> None:
-        """
-        Load multiple language files into the languages dictionary
+_languages: Dict[str, dict] = {}
+_flat_languages: Dict[str, dict] = {}
+_current_language: Optional[str] = None
 
-        Args:
-            languages (List[Dict[str, Union[str, os.PathLike]]]): List of dictionaries with language names and paths
+_json_loads = orjson.loads if orjson is not None else json.loads
 
-        Raises:
-            ValueError: If the input list or any of its elements is not correctly structured
-        """
 
-        self._check_language_list(languages=languages)
+def _flatten(data: dict, prefix: str = '', flat: Optional[dict] = None) -> dict:
+    """
+    Flatten a nested dictionary into a single-level dictionary keyed by dotted paths
+    Intermediate dictionaries are kept under their own dotted path as well
+    Non-dictionary input (a JSON document whose top level is not an object) yields an empty dictionary
 
-        for language in languages:
-            self.load_language(language['name'], language['path'])
+    Args:
+        data (dict): Nested dictionary
+        prefix (str, optional): Dotted path prefix of the current level. Defaults to ''.
+        flat (Optional[dict], optional): Dictionary to populate. Defaults to None.
 
-    async def async_load_languages(self, languages: List[Dict[str, Union[str, os.PathLike]]]) -> None:
-        """
-        Asynchronously load multiple language files into the languages dictionary
+    Returns:
+        dict: Flattened dictionary
+    """
 
-        Args:
-            languages (List[Dict[str, Union[str, os.PathLike]]]): List of dictionaries with language names and paths
+    if flat is None:
+        flat = {}
 
-        Raises:
-            ValueError: If the input list or any of its elements is not correctly structured
-        """
+    if type(data) is not dict:
+        return flat
 
-        self._check_language_list(languages=languages)
+    for k, v in data.items():
+        dotted = sys.intern(f'{prefix}{k}')
+        flat[dotted] = v
 
-        for language in languages:
-            await self.async_load_language(language['name'], language['path'])
+        if type(v) is dict:
+            _flatten(v, f'{dotted}.', flat)
 
-    def set_language(self, lang_name: str) -> None:
-        """
-        Set the current language
+    return flat
 
-        Args:
-            lang_name (str): Language name
 
-        Raises:
-            LanguageNotLoadedError: Language not loaded
-        """
+def _read_language_file(lang_path: Union[str, os.PathLike]) -> dict:
+    """
+    Read and parse a language file
 
-        if lang_name not in self.languages:
-            raise LanguageNotLoadedError(f'Language {lang_name} not loaded')
+    Args:
+        lang_path (Union[str, os.PathLike]): Path to the language file
 
-        self.language = lang_name
+    Raises:
+        LanguageFileNotFoundError: Language file not found
+        ValueError: Language file is not a valid JSON file
 
-    def get_message(self, key: str) -> str:
-        """
-        Get the translation for a key
+    Returns:
+        dict: Parsed language dictionary
+    """
 
-        Args:
-            key (str): Translation key
+    try:
+        lang_file = open(lang_path, 'rb')
+    except FileNotFoundError:
+        raise LanguageFileNotFoundError(f'Language file {lang_path} not found')
 
-        Returns:
-            str: Translation
-        """
+    with lang_file:
+        try:
+            if orjson is not None and os.fstat(lang_file.fileno()).st_size >= _MMAP_THRESHOLD:
+                with mmap.mmap(lang_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return _json_loads(memoryview(mapped))
 
-        if self.language is None:
-            raise LanguageNotLoadedError('Language not set')
+            return _json_loads(lang_file.read())
 
-        keys = key.split('.')
-        return reduce(lambda d, k: d.get(k, key) if isinstance(d, dict) else key, keys, self.languages[self.language])
+        except json.decoder.JSONDecodeError:
+            raise ValueError(f'Language file {lang_path} is not a valid JSON file')
 
-    def get_language(self) -> Optional[str]:
-        """
-        Get the current language
 
-        Returns:
-            Optional[str]: Current language
-        """
+def _validate_language_entry(language: Dict[str, Union[str, os.PathLike]]) -> Tuple[str, Union[str, os.PathLike]]:
+    """
+    Validate a single language entry and extract its name and path
 
-        return self.language
+    Args:
+        language (Dict[str, Union[str, os.PathLike]]): Dictionary with a language name and path
 
-    def get_languages(self) -> Dict[str, dict]:
-        """
-        Get the languages dictionary
+    Raises:
+        ValueError: If the entry is not correctly structured
 
-        Returns:
-            Dict[str, dict]: Languages dictionary
-        """
+    Returns:
+        Tuple[str, Union[str, os.PathLike]]: Language name and path
+    """
 
-        return self.languages
+    if type(language) is not dict:
+        raise ValueError('Each language entry must be a dictionary')
 
-    def _check_language_list(self, languages: List[Dict[str, Union[str, os.PathLike]]]) -> None:
-        """
-        Check if the input list is correctly structured
-        and raise an error if it is not.
+    try:
+        name = language['name']
+        path = language['path']
+    except KeyError:
+        raise ValueError('Each language dictionary must have "name" and "path" keys')
 
-        Args:
-            languages (List[Dict[str, Union[str, os.PathLike]]]): List of dictionaries with language names and paths
+    if type(name) is not str or not isinstance(path, (str, os.PathLike)):
+        raise ValueError('"name" must be a string and "path" must be a string or os.PathLike')
 
-        Raises:
-            ValueError: If the input list or any of its elements is not correctly structured
-            ValueError:
-            ValueError: _description_
-            ValueError: _description_
-        """
+    return name, path
 
-        if not isinstance(languages, list):
-            raise ValueError('languages must be a list of dictionaries')
 
-        for language in languages:
-            if not isinstance(language, dict):
-                raise ValueError('Each language entry must be a dictionary')
+def load_language(lang_name: str, lang_path: Union[str, os.PathLike]) -> None:
+    """
+    Load a language file into the languages dictionary
 
-            if 'name' not in language or 'path' not in language:
-                raise ValueError('Each language dictionary must have "name" and "path" keys')
+    Args:
+        lang_name (str): Language name
+        lang_path (Union[str, os.PathLike]): Path to the language file
 
-            if not isinstance(language['name'], str) or not isinstance(language['path'], (str, os.PathLike)):
-                raise ValueError('"name" must be a string and "path" must be a string or os.PathLike')
+    Raises:
+        LanguageAlreadyLoadedError: Language already loaded
+        LanguageFileNotFoundError: Language file not found
+    """
 
+    if lang_name in _languages:
+        raise LanguageAlreadyLoadedError(f'Language {lang_name} already loaded')
 
-lang_loader = LangLoader()
+    data = _read_language_file(lang_path)
+    _languages[lang_name] = data
+    _flat_languages[lang_name] = _flatten(data)
 
 
-def load_language(lang_name: str, lang_path: Union[str, os.PathLike]) -> None:
+async def async_load_language(lang_name: str, lang_path: Union[str, os.PathLike]) -> None:
     """
-    Load a language file into the languages dictionary
+    Asynchronously load a language file into the languages dictionary
 
     Args:
         lang_name (str): Language name
@@ -204,7 +155,12 @@ def load_language(lang_name: str, lang_path: Union[str, os.PathLike]) -> None:
         LanguageFileNotFoundError: Language file not found
     """
 
-    lang_loader.load_language(lang_name, lang_path)
+    if lang_name in _languages:
+        raise LanguageAlreadyLoadedError(f'Language {lang_name} already loaded')
+
+    data = await asyncio.to_thread(_read_language_file, lang_path)
+    _languages[lang_name] = data
+    _flat_languages[lang_name] = _flatten(data)
 
 
 def load_languages(languages: List[Dict[str, Union[str, os.PathLike]]]) -> None:
@@ -218,23 +174,30 @@ def load_languages(languages: List[Dict[str, Union[str, os.PathLike]]]) -> None:
         ValueError: If the input list or any of its elements is not correctly structured
     """
 
-    lang_loader.load_languages(languages)
+    if not isinstance(languages, list):
+        raise ValueError('languages must be a list of dictionaries')
 
+    if not languages:
+        return
 
-async def async_load_language(lang_name: str, lang_path: Union[str, os.PathLike]) -> None:
-    """
-    Asynchronously load a language file into the languages dictionary
+    names: List[str] = []
+    paths: List[Union[str, os.PathLike]] = []
 
-    Args:
-        lang_name (str): Language name
-        lang_path (Union[str, os.PathLike]): Path to the language file
+    for language in languages:
+        name, path = _validate_language_entry(language)
 
-    Raises:
-        LanguageAlreadyLoadedError: Language already loaded
-        LanguageFileNotFoundError: Language file not found
-    """
+        if name in _languages or name in names:
+            raise LanguageAlreadyLoadedError(f'Language {name} already loaded')
+
+        names.append(name)
+        paths.append(path)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        results = list(executor.map(_read_language_file, paths))
 
-    await lang_loader.async_load_language(lang_name, lang_path)
+    for name, data in zip(names, results):
+        _languages[name] = data
+        _flat_languages[name] = _flatten(data)
 
 
 async def async_load_languages(languages: List[Dict[str, Union[str, os.PathLike]]]) -> None:
@@ -248,7 +211,31 @@ async def async_load_languages(languages: List[Dict[str, Union[str, os.PathLike]
         ValueError: If the input list or any of its elements is not correctly structured
     """
 
-    await lang_loader.async_load_languages(languages)
+    if not isinstance(languages, list):
+        raise ValueError('languages must be a list of dictionaries')
+
+    if not languages:
+        return
+
+    names: List[str] = []
+    paths: List[Union[str, os.PathLike]] = []
+
+    for language in languages:
+        name, path = _validate_language_entry(language)
+
+        if name in _languages or name in names:
+            raise LanguageAlreadyLoadedError(f'Language {name} already loaded')
+
+        names.append(name)
+        paths.append(path)
+
+    # Gather pure reads and commit only once every file has parsed, so a
+    # failing batch leaves the stores untouched like the sync bulk loader
+    results = await asyncio.gather(*(asyncio.to_thread(_read_language_file, path) for path in paths))
+
+    for name, data in zip(names, results):
+        _languages[name] = data
+        _flat_languages[name] = _flatten(data)
 
 
 def set_language(lang_name: str) -> None:
@@ -262,7 +249,12 @@ def set_language(lang_name: str) -> None:
         LanguageNotLoadedError: Language not loaded
     """
 
-    lang_loader.set_language(lang_name)
+    global _current_language
+
+    if lang_name not in _languages:
+        raise LanguageNotLoadedError(f'Language {lang_name} not loaded')
+
+    _current_language = lang_name
 
 
 def get_current_language() -> Optional[str]:
@@ -273,7 +265,8 @@ def get_current_language() -> Optional[str]:
         Optional[str]: Current language
     """
 
-    return lang_loader.get_language()
+    return _current_language
+
 
 def get_language(lang_name: str) -> Optional[dict]:
     """
@@ -286,13 +279,14 @@ def get_language(lang_name: str) -> Optional[dict]:
         Optional[dict]: Language dictionary
     """
 
-    language: Union[dict, None] = lang_loader.get_languages().get(lang_name)
+    language: Union[dict, None] = _languages.get(lang_name)
 
     if language is None:
         raise LanguageNotLoadedError(f'Language {lang_name} not loaded')
 
     return language
 
+
 def get_languages() -> Dict[str, dict]:
     """
     Get the languages dictionary
@@ -301,7 +295,7 @@ def get_languages() -> Dict[str, dict]:
         Dict[str, dict]: Languages dictionary
     """
 
-    return lang_loader.get_languages()
+    return _languages
 
 
 def remove_language(lang_name: str) -> None:
@@ -312,10 +306,11 @@ def remove_language(lang_name: str) -> None:
         lang_name (str): Language name
     """
 
-    if not lang_loader.languages:
+    if not _languages:
         raise LanguageNotLoadedError(f'Language {lang_name} not loaded')
 
-    lang_loader.languages.pop(lang_name, None)
+    _languages.pop(lang_name, None)
+    _flat_languages.pop(lang_name, None)
 
 
 def remove_languages(lang_names: List[str]) -> None:
@@ -335,18 +330,26 @@ def remove_all_languages() -> None:
     Remove all languages from the languages dictionary
     """
 
-    lang_loader.languages = {}
+    _languages.clear()
+    _flat_languages.clear()
 
 
 def translate_message(key: str) -> str:
     """
     Get the translation for a key
+    The key can be a nested key separated by dots (example: 'key1.key2.key3')
 
     Args:
         key (str): Translation key
 
+    Raises:
+        LanguageNotLoadedError: Language not set
+
     Returns:
         str: Translation
     """
 
-    return lang_loader.get_message(key)
+    if _current_language is None:
+        raise LanguageNotLoadedError('Language not set')
+
+    return _flat_languages[_current_language].get(key, key)
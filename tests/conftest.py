@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from easyjsonpy import remove_all_languages
+
+# Expected language contents, parsed once at import so every test compares
+# against the same dict objects and dict equality can short-circuit on
+# identity for the nested parts
+EN_LANG_CONTENT: dict = json.loads(b'{"test": "test", "tests": {"test1": "Test1"}}')
+ES_LANG_CONTENT: dict = json.loads(b'{"test": "prueba", "tests": {"test1": "Prueba1"}}')
+
+
+@pytest.fixture(autouse=True)
+def _clean_languages():
+    """
+    Reset the global language state after every test so no test depends
+    on the execution order of the others
+    """
+
+    yield
+    remove_all_languages()
+
+
+@pytest.fixture(scope="session")
+def lang_dir(tmp_path_factory):
+    """
+    Directory containing the language files, materialized once per session
+    from the canonical content constants
+    """
+
+    directory = tmp_path_factory.mktemp("langs")
+    (directory / "en.json").write_text(json.dumps(EN_LANG_CONTENT))
+    (directory / "es.json").write_text(json.dumps(ES_LANG_CONTENT))
+    return directory
+
+
+@pytest.fixture(scope="session")
+def en_content() -> dict:
+    """
+    Expected content of the english language file
+    """
+
+    return EN_LANG_CONTENT
+
+
+@pytest.fixture(scope="session")
+def es_content() -> dict:
+    """
+    Expected content of the spanish language file
+    """
+
+    return ES_LANG_CONTENT
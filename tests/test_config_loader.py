@@ -1,7 +1,13 @@
+import json
+import os
+import pickle
+
 import pytest
 
+from easyjsonpy import config_loader
 from easyjsonpy import (
     load_configuration,
+    load_configuration_subset,
     async_load_configuration,
     load_configurations,
     async_load_configurations,
@@ -10,6 +16,7 @@ from easyjsonpy import (
     get_config_value,
     async_set_config_value,
     set_config_value,
+    flush_config,
     remove_configuration,
     remove_all_configurations
 )
@@ -73,16 +80,21 @@ def test_load_configuration_already_loaded():
         load_configuration('test', CONFIG_PATH)
 
 
-def test_set_config_value():
+def test_set_config_value(tmp_path):
     """
     Test that a configuration value is set
     """
 
-    set_config_value('test', 'test2', 'test')
-    assert get_config_value('test2', 'test') == 'test2'
+    # Work on a throwaway copy so the write-back never touches the checked-in fixture
+    config_path = tmp_path / 'config.json'
+    config_path.write_text(json.dumps(CONFIG_CONTENT))
+    load_configuration('setvalue', config_path)
+
+    set_config_value('test', 'test2', 'setvalue')
+    assert get_config_value('test', 'setvalue') == 'test2'
+    assert json.loads(config_path.read_text())['test'] == 'test2'
 
-    # Reset the configuration value
-    set_config_value('test', 'test', 'test')
+    remove_configuration('setvalue')
 
 
 def test_set_config_value_not_loaded():
@@ -170,15 +182,153 @@ async def test_async_load_configurations():
 
 
 @pytest.mark.asyncio
-async def test_async_set_config_value():
+async def test_async_load_configurations_failed_batch_is_atomic(tmp_path):
+    """
+    Test that a failing async batch leaves no configuration from the batch loaded
+    """
+
+    remove_all_configurations()
+    config_path = tmp_path / 'config.json'
+    config_path.write_text(json.dumps(CONFIG_CONTENT))
+
+    with pytest.raises(ConfigurationFileNotFoundError):
+        await async_load_configurations([
+            {'name': 'ok', 'path': config_path},
+            {'name': 'missing', 'path': tmp_path / 'missing.json'},
+        ])
+
+    assert get_configurations() == {}
+
+
+@pytest.mark.asyncio
+async def test_async_set_config_value(tmp_path):
     """
     Test that a configuration value is set asynchronously
     """
 
+    # Work on a throwaway copy so the write-back never touches the checked-in fixture
+    config_path = tmp_path / 'config.json'
+    config_path.write_text(json.dumps(CONFIG_CONTENT))
+
     remove_all_configurations()
-    await async_load_configuration('test', CONFIG_PATH)
-    await async_set_config_value('test', 'test2', 'test')
-    assert get_config_value('test2', 'test') == 'test2'
+    await async_load_configuration('setvalue', config_path)
+
+    await async_set_config_value('test', 'test2', 'setvalue')
+    assert get_config_value('test', 'setvalue') == 'test2'
+    assert json.loads(config_path.read_text())['test'] == 'test2'
+
+    remove_all_configurations()
+
+
+@pytest.mark.parametrize('with_ijson', [True, False])
+def test_load_configuration_subset(with_ijson, tmp_path, monkeypatch):
+    """
+    Test that only the requested top-level keys of a configuration are loaded,
+    both through the ijson streaming path and the full-parse fallback
+    """
+
+    if with_ijson:
+        pytest.importorskip('ijson')
+    else:
+        monkeypatch.setattr(config_loader, 'ijson', None)
+
+    config_path = tmp_path / 'subset.json'
+    config_path.write_text(json.dumps({'a': 1, 'b': {'c': 2}, 'd': 3}))
+
+    load_configuration_subset('subset', config_path, ['a', 'b'])
+    assert get_configuration('subset') == {'a': 1, 'b': {'c': 2}}
+    assert get_config_value('b.c', 'subset') == 2
+
+    remove_configuration('subset')
+
+
+def test_set_config_value_deferred(tmp_path):
+    """
+    Test that a deferred configuration change is not written to disk until
+    flush_config is called
+    """
+
+    config_path = tmp_path / 'deferred.json'
+    config_path.write_text(json.dumps({'test': 'test'}))
+    load_configuration('deferred', config_path)
+
+    set_config_value('test', 'test2', 'deferred', flush=False)
+    assert get_config_value('test', 'deferred') == 'test2'
+    assert json.loads(config_path.read_text()) == {'test': 'test'}
+
+    flush_config()
+    assert json.loads(config_path.read_text()) == {'test': 'test2'}
+
+    remove_configuration('deferred')
+
+
+def test_flush_config_not_loaded():
+    """
+    Test that flushing a configuration that is not loaded raises a ConfigurationNotLoadedError
+    """
+
+    with pytest.raises(ConfigurationNotLoadedError):
+        flush_config('notloaded')
+
+
+def test_load_configuration_use_cache(tmp_path):
+    """
+    Test that use_cache writes a sidecar cache, reuses it while the source
+    file's mtime is unchanged, and discards it when the mtime changes
+    """
+
+    config_path = tmp_path / 'cached.json'
+    config_path.write_text(json.dumps({'test': 'test'}))
+
+    load_configuration('cached', config_path, use_cache=True)
+    assert get_configuration('cached') == {'test': 'test'}
+    remove_configuration('cached')
+
+    cache_path = tmp_path / 'cached.json.cache.pkl'
+    assert cache_path.exists()
+
+    # Doctor the sidecar so a cache hit is observable on the warm reload
+    mtime = os.stat(config_path).st_mtime_ns
+    cache_path.write_bytes(pickle.dumps({'mtime': mtime, 'data': {'test': 'cached'}}))
+    load_configuration('cached', config_path, use_cache=True)
+    assert get_configuration('cached') == {'test': 'cached'}
+    remove_configuration('cached')
+
+    # A changed source mtime invalidates the cache and forces a re-parse
+    os.utime(config_path, ns=(mtime + 1, mtime + 1))
+    load_configuration('cached', config_path, use_cache=True)
+    assert get_configuration('cached') == {'test': 'test'}
+    remove_configuration('cached')
+
+
+def test_load_configuration_large_file(tmp_path):
+    """
+    Test that a configuration file large enough for the mmap parse path loads correctly
+    """
+
+    content = {f'key{i}': f'value{i}' for i in range(50_000)}
+    config_path = tmp_path / 'big.json'
+    config_path.write_text(json.dumps(content))
+    assert config_path.stat().st_size >= config_loader._MMAP_THRESHOLD
+
+    load_configuration('big', config_path)
+    assert get_configuration('big') == content
+    assert get_config_value('key123', 'big') == 'value123'
+
+    remove_configuration('big')
+
+
+def test_load_configuration_non_object(tmp_path):
+    """
+    Test that a configuration file whose top level is not an object still loads
+    and degrades gracefully at lookup time
+    """
+
+    config_path = tmp_path / 'array.json'
+    config_path.write_text('[1, 2, 3]')
+
+    load_configuration('array', config_path)
+    assert get_configuration('array') == [1, 2, 3]
+    assert get_config_value('test', 'array') == 'test'
 
-    # Reset the configuration value
-    await async_set_config_value('test', 'test', 'test')
\ No newline at end of file
+    remove_configuration('array')
\ No newline at end of file
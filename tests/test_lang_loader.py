@@ -1,5 +1,8 @@
-import os
+import asyncio
+import functools
 import json
+import timeit
+
 import pytest
 
 from easyjsonpy import (
@@ -16,16 +19,45 @@ from easyjsonpy import (
     remove_all_languages,
     translate_message,
 )
+from easyjsonpy.lang_loader import _MMAP_THRESHOLD
 from easyjsonpy.exceptions import (
     LanguageAlreadyLoadedError,
     LanguageNotLoadedError,
     LanguageFileNotFoundError,
 )
 
-EN_LANG_PATH: str = "tests/en.json"
-EN_LANG_CONTENT: dict = {'test': 'test', 'tests': { 'test1': 'Test1' }}
-ES_LANG_PATH: str = "tests/es.json"
-ES_LANG_CONTENT: dict = {'test': 'prueba', 'tests': { 'test1': 'Prueba1' }}
+EXPECTED_NAMES_BOTH: frozenset = frozenset({'en', 'es'})
+REMOVE_SPEC: tuple = ('en', 'es')
+
+
+@pytest.fixture(scope="session")
+def load_spec(lang_dir):
+    """
+    Argument spec for loading both languages, built once per session
+    """
+
+    return (
+        {'name': 'en', 'path': lang_dir / 'en.json'},
+        {'name': 'es', 'path': lang_dir / 'es.json'},
+    )
+
+
+@pytest.fixture
+def loaded_en(lang_dir):
+    """
+    Load the english language for tests that need it preloaded
+    """
+
+    load_language('en', lang_dir / 'en.json')
+
+
+@pytest.fixture
+def loaded_both(load_spec):
+    """
+    Load the english and spanish languages for tests that need both preloaded
+    """
+
+    load_languages(list(load_spec))
 
 
 def test_no_languages_loaded():
@@ -53,25 +85,60 @@ def test_load_language_not_found():
         load_language('en', 'notfound.json')
 
 
-def test_load_language():
+@pytest.mark.parametrize('name', ['en', 'es'])
+def test_load_language(name, lang_dir, request):
     """
     Test that a language is loaded
     """
 
-    load_language('en', EN_LANG_PATH)
-    assert get_languages() == {'en': EN_LANG_CONTENT}
+    load_language(name, lang_dir / f'{name}.json')
+    langs = get_languages()
+    assert langs == {name: request.getfixturevalue(f'{name}_content')}
 
 
-def test_load_language_already_loaded():
+def test_load_language_already_loaded(loaded_en, lang_dir):
     """
     Test that loading a language that is already loaded raises a LanguageAlreadyLoadedError
     """
 
     with pytest.raises(LanguageAlreadyLoadedError):
-        load_language('en', EN_LANG_PATH)
+        load_language('en', lang_dir / 'en.json')
 
 
-def test_set_language():
+def test_load_language_large_file(tmp_path):
+    """
+    Test that a language file large enough for the mmap parse path loads correctly
+    """
+
+    content = {f'key{i}': f'value{i}' for i in range(50_000)}
+    lang_path = tmp_path / 'big.json'
+    lang_path.write_text(json.dumps(content))
+    assert lang_path.stat().st_size >= _MMAP_THRESHOLD
+
+    load_language('big', lang_path)
+    assert get_language('big') == content
+
+    set_language('big')
+    assert translate_message('key123') == 'value123'
+
+
+def test_load_language_non_object(tmp_path):
+    """
+    Test that a language file whose top level is not an object still loads
+    and degrades gracefully at translation time
+    """
+
+    lang_path = tmp_path / 'array.json'
+    lang_path.write_text('[1, 2, 3]')
+
+    load_language('array', lang_path)
+    assert get_language('array') == [1, 2, 3]
+
+    set_language('array')
+    assert translate_message('test') == 'test'
+
+
+def test_set_language(loaded_en):
     """
     Test that the current language is set
     """
@@ -80,122 +147,197 @@ def test_set_language():
     assert translate_message('test') == 'test'
 
 
-def test_current_language():
+def test_current_language(loaded_en):
     """
     Test that the current language is retrieved
     """
 
+    set_language('en')
     assert get_current_language() == 'en'
 
 
-def test_get_language():
+def test_get_language(loaded_en, en_content):
     """
     Test that a language is retrieved
     """
 
-    assert get_language('en') == EN_LANG_CONTENT
+    assert get_language('en') == en_content
 
 
-def test_remove_language():
+def test_remove_language(loaded_en):
     """
     Test that a language is removed
     """
 
     remove_language('en')
-    assert get_languages() == {}
+    langs = get_languages()
+    assert langs == {}
 
 
-def test_load_languages():
+def test_load_languages(load_spec, en_content, es_content):
     """
     Test that multiple languages are loaded
     """
 
-    load_languages([
-        {'name': 'en', 'path': EN_LANG_PATH},
-        {'name': 'es', 'path': ES_LANG_PATH}
-    ])
+    load_languages(list(load_spec))
 
-    assert get_languages() == {
-        'en': EN_LANG_CONTENT,
-        'es': ES_LANG_CONTENT,
-    }
+    langs = get_languages()
+    assert set(langs) == EXPECTED_NAMES_BOTH
+    assert langs['en'] == en_content
+    assert langs['es'] == es_content
 
 
-def test_remove_languages():
+def test_remove_languages(loaded_both):
     """
     Test that multiple languages are removed
     """
 
-    remove_languages(['en', 'es'])
-    assert get_languages() == {}
+    remove_languages(list(REMOVE_SPEC))
+    langs = get_languages()
+    assert langs == {}
 
 
-def test_remove_all_languages():
+def test_remove_all_languages(loaded_both):
     """
     Test that all languages are removed
     """
 
-    load_languages([
-        {'name': 'en', 'path': EN_LANG_PATH},
-        {'name': 'es', 'path': ES_LANG_PATH}
-    ])
-
     remove_all_languages()
-    assert get_languages() == {}
+    langs = get_languages()
+    assert langs == {}
 
 
-def test_load_languages_already_loaded():
+def test_load_languages_already_loaded(loaded_both, load_spec):
     """
     Test that loading multiple languages that are already loaded raises a LanguageAlreadyLoadedError
     """
 
-    load_languages([
-        {'name': 'en', 'path': EN_LANG_PATH},
-        {'name': 'es', 'path': ES_LANG_PATH}
-    ])
-
     with pytest.raises(LanguageAlreadyLoadedError):
-        load_languages([
-            {'name': 'en', 'path': EN_LANG_PATH},
-            {'name': 'es', 'path': ES_LANG_PATH}
-        ])
+        load_languages(list(load_spec))
 
 
-def test_translate_message():
+@pytest.mark.parametrize('name, expected', [('en', 'test'), ('es', 'prueba')])
+def test_translate_message(name, expected, loaded_both):
     """
     Test that a message is translated
     """
 
+    set_language(name)
+    assert translate_message('test') == expected
+
+
+def test_translate_message_is_cacheable(loaded_both):
+    """
+    Test that translate_message behaves like a pure function for a fixed
+    language, so callers can safely wrap it in a memoization cache
+    """
+
     set_language('en')
-    assert translate_message('test') == 'test'
-    set_language('es')
-    assert translate_message('test') == 'prueba'
+    cached = functools.lru_cache(maxsize=1024)(translate_message)
+
+    for _ in range(10_000):
+        for key in ('test', 'tests.test1', 'missing'):
+            assert cached(key) == translate_message(key)
+
+    info = cached.cache_info()
+    assert info.hits > 0
+    assert info.currsize == 3
+
+
+def test_single_entry_fast_path(tmp_path):
+    """
+    Test that translating from a single-entry language stays within a small
+    factor of a plain dict lookup, so the lookup structure never regresses
+    the common small-dictionary case
+    """
+
+    lang_path = tmp_path / 'x.json'
+    lang_path.write_text(json.dumps({'k': 'v'}))
+    load_language('x', lang_path)
+    set_language('x')
+
+    baseline = min(timeit.repeat(lambda: {'k': 'v'}['k'], number=100_000, repeat=5))
+    actual = min(timeit.repeat(lambda: translate_message('k'), number=100_000, repeat=5))
+    assert actual < baseline * 20
+
+
+def test_translate_benchmark(loaded_both, request):
+    """
+    Benchmark translate_message on a hot key so hot-path regressions show
+    up in CI; skipped when pytest-benchmark is not installed
+    """
+
+    pytest.importorskip('pytest_benchmark')
+    benchmark = request.getfixturevalue('benchmark')
+
+    set_language('en')
+    assert benchmark(translate_message, 'test') == 'test'
 
 
 @pytest.mark.asyncio
-async def test_async_load_language():
+@pytest.mark.parametrize('name', ['en', 'es'])
+async def test_async_load_language(name, lang_dir, request):
     """
     Test that a language is loaded asynchronously
     """
 
-    remove_all_languages()
-    await async_load_language('en', EN_LANG_PATH)
-    assert get_languages() == {'en': EN_LANG_CONTENT}
+    await async_load_language(name, lang_dir / f'{name}.json')
+    langs = get_languages()
+    assert langs == {name: request.getfixturevalue(f'{name}_content')}
 
 
 @pytest.mark.asyncio
-async def test_async_load_languages():
+async def test_async_load_languages(load_spec, en_content, es_content):
     """
     Test that multiple languages are loaded asynchronously
     """
 
-    remove_all_languages()
-    await async_load_languages([
-        {'name': 'en', 'path': EN_LANG_PATH},
-        {'name': 'es', 'path': ES_LANG_PATH}
-    ])
-
-    assert get_languages() == {
-        'en': EN_LANG_CONTENT,
-        'es': ES_LANG_CONTENT,
-    }
+    await async_load_languages(list(load_spec))
+
+    langs = get_languages()
+    assert set(langs) == EXPECTED_NAMES_BOTH
+    assert langs['en'] == en_content
+    assert langs['es'] == es_content
+
+
+@pytest.mark.asyncio
+async def test_async_load_languages_failed_batch_is_atomic(lang_dir):
+    """
+    Test that a failing async batch leaves no language from the batch loaded
+    """
+
+    with pytest.raises(LanguageFileNotFoundError):
+        await async_load_languages([
+            {'name': 'en', 'path': lang_dir / 'en.json'},
+            {'name': 'missing', 'path': lang_dir / 'missing.json'},
+        ])
+
+    assert get_languages() == {}
+
+
+@pytest.mark.asyncio
+async def test_async_load_languages_concurrently(lang_dir, en_content, es_content):
+    """
+    Test that independent language loads can run concurrently through asyncio.gather
+    """
+
+    await asyncio.gather(
+        async_load_language('en', lang_dir / 'en.json'),
+        async_load_language('es', lang_dir / 'es.json'),
+    )
+
+    langs = get_languages()
+    assert set(langs) == EXPECTED_NAMES_BOTH
+    assert langs['en'] == en_content
+    assert langs['es'] == es_content
+
+
+@pytest.mark.asyncio
+async def test_load_language_in_thread(lang_dir, en_content):
+    """
+    Test that the sync loader can be offloaded to a worker thread from async code
+    """
+
+    await asyncio.to_thread(load_language, 'en', lang_dir / 'en.json')
+    langs = get_languages()
+    assert langs == {'en': en_content}